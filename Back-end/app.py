@@ -1,4 +1,5 @@
-from flask import Flask, render_template, request, redirect, url_for, flash, session, jsonify
+from flask import Flask, render_template, request, redirect, url_for, flash, session, jsonify, make_response, g, has_request_context
+from flask.json.provider import DefaultJSONProvider
 import sys
 import os
 
@@ -7,25 +8,36 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from flask_sqlalchemy import SQLAlchemy
 from flask_cors import CORS
-from sqlalchemy import text
+from flask_compress import Compress
+from flask_caching import Cache
+from sqlalchemy import text, select, insert, union_all, literal, func, delete, event, inspect
+from sqlalchemy.orm import joinedload, selectinload, load_only
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 import random
-import json
-import io
-from flask import send_file
+import hashlib
+import logging
+from functools import wraps
+from collections import Counter
+import unicodedata
+from urllib.parse import quote
 from reportlab.lib.pagesizes import letter
 from reportlab.pdfgen import canvas
 
 from werkzeug.utils import secure_filename
+from werkzeug.security import generate_password_hash, check_password_hash
 from werkzeug.middleware.proxy_fix import ProxyFix
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
-import requests
+import orjson
 from itsdangerous import URLSafeTimedSerializer
 
 # Make sure all your model definitions are in a file named 'models.py'
 from models import db, Character, Race, Class, Background, Skill, Equipment, User, Spell, Feat, Trait
+from models import character_proficiencies, character_equipment, character_spells, character_feats
+from constants import RACES, CLASSES, BACKGROUNDS, SKILLS, EQUIPMENT, SPELLS, FEATS, CLASS_SKILL_RULES, ABILITIES
 
 
 # --- Paths / Uploads ---
@@ -41,12 +53,52 @@ os.makedirs(UPLOAD_FOLDER, exist_ok=True)
 app = Flask(__name__, template_folder='../Front-end', static_folder='../Front-end/static')
 app.url_map.strict_slashes = False
 
+
+# --- JSON Serialization ---
+# orjson is a compiled encoder and is several times faster than the stdlib json module
+# on our list-of-dicts payloads. Plugging it in as the provider means every existing
+# jsonify() / request.get_json() call picks it up without touching the routes.
+class ORJSONProvider(DefaultJSONProvider):
+    # Flask sorts keys by default; our dicts are built in a stable order already, so skip
+    # the per-dict sort on every response.
+    sort_keys = False
+
+    def _dump_bytes(self, obj, sort_keys, indent):
+        option = orjson.OPT_NON_STR_KEYS
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option)
+
+    def dumps(self, obj, **kwargs):
+        return self._dump_bytes(obj, kwargs.get("sort_keys", self.sort_keys), kwargs.get("indent")).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        # jsonify() path: orjson already produces bytes, so hand them straight to the
+        # Response instead of decoding to str and letting Werkzeug encode them again.
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        body = self._dump_bytes(obj, self.sort_keys, indent)
+        return self._app.response_class(body + b"\n", mimetype=self.mimetype)
+
+
+app.json = ORJSONProvider(app)
+
 IS_DEV = (
     os.environ.get("ENV") == "dev"
     or os.environ.get("FLASK_ENV") == "development"
     or not os.environ.get("FRONTEND_ORIGIN") # Assume dev if this is missing
 )
 
+# Request handlers log through app.logger with lazy %-args instead of print(). In production
+# only INFO and up is emitted (e.g. failed logins); debug() calls return before formatting.
+if not IS_DEV:
+    app.logger.setLevel(logging.INFO)
+
 # IMPORTANT: In production, you should set FRONTEND_ORIGIN in Render:
 # FRONTEND_ORIGIN=https://cipherers.github.io
 FRONTEND_ORIGIN = os.environ.get("FRONTEND_ORIGIN")
@@ -61,6 +113,18 @@ CORS(app, supports_credentials=True, origins=[FRONTEND_ORIGIN],
      methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"])
 
 
+# --- Response Compression ---
+# JSON lists are very repetitive and gzip down to a fraction of their size.
+# Only JSON is worth it here (static files are served by GitHub Pages); level 4 keeps CPU
+# low while getting most of the size win, and tiny bodies aren't worth the framing overhead.
+app.config.update(
+    COMPRESS_MIMETYPES=['application/json'],
+    COMPRESS_LEVEL=4,
+    COMPRESS_MIN_SIZE=500,
+)
+Compress(app)
+
+
 # --- Proxy Support ---
 # Tell Flask it's behind a proxy to correctly handle HTTPS and IP addresses.
 app.wsgi_app = ProxyFix(app.wsgi_app, x_for=1, x_proto=1, x_host=1, x_prefix=1)
@@ -70,31 +134,42 @@ app.wsgi_app = ProxyFix(app.wsgi_app, x_for=1, x_proto=1, x_host=1, x_prefix=1)
 # Set this in Render AND as a Secret in Worker settings: PROXY_SECRET
 PROXY_SECRET = os.environ.get("PROXY_SECRET")
 
-@app.before_request
-def require_proxy_secret():
+
+class ProxySecretMiddleware:
     """
     Blocks direct calls to Render by requiring the Worker to send X-Proxy-Secret.
-    Enable in production only. In dev, we skip this.
+    Runs as plain WSGI in front of Flask, so rejected traffic never gets a request
+    context, session or routing; the responses are pre-built bytes.
     """
-    if IS_DEV:
-        return None
-
     # Optional: allow health checks without the secret
-    if request.path == "/health":
-        return None
-
-    # If you want the root route public, allow it (optional):
-    # if request.path == "/":
-    #     return None
-
-    if not PROXY_SECRET:
-        return jsonify({"error": "Server misconfigured: PROXY_SECRET missing"}), 500
-
-    sent = request.headers.get("X-Proxy-Secret")
-    if sent != PROXY_SECRET:
-        return jsonify({"error": "Forbidden"}), 403
-
-    return None
+    # (add "/" here if you want the root route public)
+    PUBLIC_PATHS = frozenset({"/health"})
+    FORBIDDEN = ("403 FORBIDDEN", b'{"error":"Forbidden"}')
+    MISCONFIGURED = ("500 INTERNAL SERVER ERROR", b'{"error":"Server misconfigured: PROXY_SECRET missing"}')
+
+    def __init__(self, wsgi_app, secret):
+        self.wsgi_app = wsgi_app
+        self.secret = secret
+
+    def __call__(self, environ, start_response):
+        if environ.get("PATH_INFO") in self.PUBLIC_PATHS:
+            return self.wsgi_app(environ, start_response)
+        if not self.secret:
+            return self._reject(start_response, *self.MISCONFIGURED)
+        if environ.get("HTTP_X_PROXY_SECRET") != self.secret:
+            return self._reject(start_response, *self.FORBIDDEN)
+        return self.wsgi_app(environ, start_response)
+
+    @staticmethod
+    def _reject(start_response, status, body):
+        start_response(status, [("Content-Type", "application/json"), ("Content-Length", str(len(body)))])
+        return [body]
+
+
+# Enable in production only. In dev, we skip this.
+# Outermost layer, so it runs before ProxyFix and the whole Flask dispatch.
+if not IS_DEV:
+    app.wsgi_app = ProxySecretMiddleware(app.wsgi_app, PROXY_SECRET)
 
 
 # --- Security: Enforce HTTPS ---
@@ -111,9 +186,6 @@ def enforce_https():
         return redirect(url, code=301)
 
 
-        return redirect(url, code=301)
-
-
 @app.before_request
 def check_auth_token():
     """
@@ -145,20 +217,61 @@ def health_check():
     return jsonify({'status': 'healthy', 'message': 'DnD Character Creator API is up and running'}), 200
 
 
+# Render Redis add-on. When set, both the rate limiter and the response cache are shared
+# by all gunicorn workers; without it each process keeps its own in-memory state.
+REDIS_URL = os.environ.get("REDIS_URL")
+
+
 # --- Security: Rate Limiting ---
-# In production on Render, memory:// resets on restart and isn't shared.
-# For now, we continue with memory:// as requested, but noted the limitation.
+# memory:// counters are per process, so with N workers every limit is effectively N times
+# looser (and they reset on restart). RATELIMIT_STORAGE_URI wins if set, then REDIS_URL;
+# memory:// is only the fallback for local development.
+# fixed-window is the cheapest strategy: one counter increment per hit, no sliding-window
+# bookkeeping and no Lua script per request on Redis.
+RATELIMIT_STORAGE_URI = os.environ.get("RATELIMIT_STORAGE_URI") or REDIS_URL or "memory://"
 limiter = Limiter(
     get_remote_address,
     app=app,
     default_limits=["200 per day", "50 per hour"],
-    storage_uri="memory://",
+    storage_uri=RATELIMIT_STORAGE_URI,
+    # Redis only: a slow/unreachable Redis must not stall every request, so fail fast and
+    # count in memory until it comes back.
+    storage_options={"socket_connect_timeout": 1} if RATELIMIT_STORAGE_URI.startswith("redis") else {},
+    in_memory_fallback_enabled=RATELIMIT_STORAGE_URI != "memory://",
+    strategy="fixed-window",
+    headers_enabled=True,  # X-RateLimit-* / Retry-After so the frontend can back off
 )
 
 
+# --- Response Cache ---
+# Reference lists are read on every page load but almost never change.
+if REDIS_URL:
+    import redis
+    # Our own client instead of CACHE_REDIS_URL so it gets timeouts: like the limiter, a slow or
+    # unreachable Redis should cost a second at most, after which the cache is skipped.
+    CACHE_CONFIG = {
+        "CACHE_TYPE": "RedisCache",
+        "CACHE_REDIS_HOST": redis.from_url(REDIS_URL, socket_connect_timeout=1, socket_timeout=1),
+    }
+else:
+    CACHE_CONFIG = {"CACHE_TYPE": "SimpleCache"}
+cache = Cache(app, config={**CACHE_CONFIG, "CACHE_DEFAULT_TIMEOUT": 300})
+
+
 # --- DB Config ---
 app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///site.db'
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+# Default pool (5 + 10 overflow) is tight once gthread workers overlap PDF downloads.
+# pre_ping drops dead connections after a DB restart; recycle guards against idle timeouts.
+app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
+    'pool_size': 20,
+    'max_overflow': 20,
+    'pool_pre_ping': True,
+    'pool_recycle': 1800,
+    # Pooled connections move between worker threads; SQLAlchemy 2.x already defaults this
+    # for file databases, spelled out so a config change can't quietly bring the check back.
+    'connect_args': {'check_same_thread': False},
+}
 
 
 # --- Security: Secret Key ---
@@ -200,39 +313,222 @@ def allowed_file(filename: str) -> bool:
 db.init_app(app)
 
 
+def _sqlite_pragmas(dbapi_conn, _connection_record):
+    """
+    Per-connection SQLite tuning. WAL lets readers keep going while a write commits, and
+    synchronous=NORMAL skips the fsync on every commit (still crash-safe in WAL mode).
+    """
+    cur = dbapi_conn.cursor()
+    cur.execute("PRAGMA journal_mode=WAL")
+    cur.execute("PRAGMA synchronous=NORMAL")
+    cur.execute("PRAGMA cache_size=-20000")  # ~20 MB page cache
+    cur.execute("PRAGMA temp_store=MEMORY")
+    cur.execute("PRAGMA mmap_size=268435456")  # 256 MB; reads skip the read() syscall copy
+    cur.close()
+
+
+with app.app_context():
+    event.listen(db.engine, "connect", _sqlite_pragmas)
+
+
+# --- Dev-only N+1 detector ---
+# Counts the SQL statements each request executes and warns when the same statement runs
+# repeatedly, which is what a lazy load inside a loop looks like. Fix reported sites with
+# joinedload/selectinload. Never registered in production, so it costs nothing there.
+N_PLUS_ONE_THRESHOLD = 3
+
+
+def _count_statement(conn, cursor, statement, parameters, context, executemany):
+    if has_request_context():
+        if 'sql_statements' not in g:
+            g.sql_statements = Counter()
+        g.sql_statements[statement] += 1
+
+
+def _report_repeated_statements(response):
+    counts = g.pop('sql_statements', None)
+    for statement, runs in (counts or {}).items():
+        if runs >= N_PLUS_ONE_THRESHOLD:
+            app.logger.warning("Possible N+1 in %s %s: ran %d times: %s",
+                               request.method, request.path, runs, " ".join(statement.split()))
+    return response
+
+
+if IS_DEV:
+    with app.app_context():
+        event.listen(db.engine, "before_cursor_execute", _count_statement)
+    app.after_request(_report_repeated_statements)
+
+
+def cached_static_json(view):
+    """
+    For endpoints that return the same JSON to every user (reference data).
+    Adds an ETag and 'no-cache': browsers and the Cloudflare edge may keep a copy but must
+    revalidate it with If-None-Match on every use, which costs a bodyless 304 while the data is
+    unchanged and picks up /add-dnd-info additions immediately.
+    Only marked public when the response sets no cookie: if check_auth_token just put an
+    X-Auth-Token user into the session, the Set-Cookie must never reach a shared cache.
+    """
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        resp = make_response(view(*args, **kwargs))
+        resp.cache_control.no_cache = True
+        if session.modified:
+            resp.cache_control.private = True
+        else:
+            resp.cache_control.public = True
+        resp.add_etag()
+        return resp.make_conditional(request)
+    return wrapper
+
+
+def table_version(*models):
+    """
+    (COUNT(id), MAX(id)) for each model, from a single SELECT.
+    For tables whose rows are only ever inserted this is a cheap version stamp.
+    """
+    columns = []
+    for model in models:
+        columns.append(select(func.count(model.id)).scalar_subquery())
+        columns.append(select(func.max(model.id)).scalar_subquery())
+    return tuple(db.session.execute(select(*columns)).one())
+
+
+def versioned_by_table(model):
+    """
+    Conditional-GET short-circuit for reference lists whose rows are only ever inserted.
+    COUNT(*) + MAX(id) is a cheap version stamp for such a table: if the client's ETag still
+    matches we answer 304 before the view (or its cache) does any work.
+    The ETag is weak so Flask-Compress leaves it alone instead of suffixing ':gzip'.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            count, max_id = table_version(model)
+            etag = hashlib.blake2b(f"{count}:{max_id}".encode(), digest_size=8).hexdigest()
+            if request.if_none_match.contains_weak(etag):
+                resp = app.response_class(status=304)
+            else:
+                resp = make_response(view(*args, **kwargs))
+            resp.set_etag(etag, weak=True)
+            return resp
+        return wrapper
+    return decorator
+
+
+SQLITE_MAX_INT = 2 ** 63 - 1  # anything larger can't be bound to an INTEGER column
+
+
+def existing_ids(model, raw_ids):
+    """Return the subset of raw_ids (form strings or JSON ints) that are real primary keys of model.
+
+    Checked against the database, not a cached pick list: with a per-process cache another
+    worker's /add-dnd-info could make a real id look unknown. Only the id column is selected,
+    so no ORM objects are built just to validate input. Anything that isn't a positive id in
+    SQLite's integer range ('abc', '²', 10**30, null, true) is dropped rather than raising.
+    """
+    ids = set()
+    for raw in raw_ids:
+        if isinstance(raw, bool) or not isinstance(raw, (int, str)):
+            continue
+        try:
+            value = int(raw)
+        except ValueError:
+            continue
+        if 0 < value <= SQLITE_MAX_INT:
+            ids.add(value)
+    if not ids:
+        return []
+    return db.session.execute(select(model.id).where(model.id.in_(ids))).scalars().all()
+
+
+# Class/skill rows only change through /add-dnd-info, so the mapping is built once and
+# reused while the classes/skills version stamp is unchanged. The stamp also catches inserts
+# made by other gunicorn workers, which never call invalidate_class_skill_map() here.
+# Stored as one (token, mapping) tuple so threads never see a token paired with the wrong map.
+_CLASS_SKILL_CACHE = (None, None)
+
+
 def get_class_skill_map():
-    """Return a dict mapping Class.name -> list of allowed Skill IDs."""
-    rules = {
-        'fighter': ['Athletics', 'Survival', 'Intimidation'],
-        'wizard': ['Stealth'],
-        'rogue': ['Stealth', 'Acrobatics', 'Deception'],
-        'cleric': ['History', 'Insight', 'Medicine'],
-        'ranger': ['Survival', 'Nature', 'Perception'],
-        'paladin': ['Religion', 'Intimidation', 'Persuasion'],
-        'bard': ['Performance', 'Persuasion', 'Deception'],
-        'druid': ['Animal Handling', 'Nature', 'Survival'],
-        'monk': ['Acrobatics', 'Stealth', 'Athletics'],
-        'barbarian': ['Athletics', 'Intimidation', 'Survival'],
-        'sorcerer': ['Arcana', 'Deception', 'Persuasion'],
-        'warlock': ['Arcana', 'Deception', 'Intimidation'],
-        'artificer': ['Arcana', 'History', 'Investigation'],
-    }
-    skills = {s.name.lower(): s.id for s in Skill.query.all()}
+    """Return a dict mapping Class.name -> tuple of allowed Skill IDs (shared, read-only)."""
+    global _CLASS_SKILL_CACHE
+    token = table_version(Class, Skill)
+    cached_token, mapping = _CLASS_SKILL_CACHE
+    if mapping is None or cached_token != token:
+        mapping = _build_class_skill_map()
+        _CLASS_SKILL_CACHE = (token, mapping)
+    return mapping
+
+
+def invalidate_class_skill_map():
+    global _CLASS_SKILL_CACHE
+    _CLASS_SKILL_CACHE = (None, None)
+
+
+# CLASS_SKILL_RULES with its skill names pre-lowercased, so a rebuild only does dict lookups.
+_CLASS_SKILL_RULES_LOWER = {
+    class_key: [name.lower() for name in skill_names]
+    for class_key, skill_names in CLASS_SKILL_RULES.items()
+}
+
+
+def _build_class_skill_map():
+    # One skills query up front; classes without a rule reuse it instead of re-querying.
+    # Only (id, name) columns are needed, so no ORM objects are built.
+    all_skills = db.session.execute(select(Skill.id, Skill.name)).all()
+    skills = {name.lower(): skill_id for skill_id, name in all_skills}
+    # Tuples, because the mapping is cached and shared; classes without a rule all point at
+    # this one tuple instead of each getting a copy.
+    all_skill_ids = tuple(skill_id for skill_id, _ in all_skills)
     mapping = {}
-    for cls in Class.query.all():
-        allowed_names = rules.get(cls.name.lower(), None)
+    for class_name in db.session.scalars(select(Class.name)):
+        allowed_names = _CLASS_SKILL_RULES_LOWER.get(class_name.lower())
         if allowed_names is None:
-            mapping[cls.name] = [s.id for s in Skill.query.all()]
+            mapping[class_name] = all_skill_ids
         else:
-            mapped_ids = []
-            for name in allowed_names:
-                skill_id = skills.get(name.lower())
-                if skill_id:
-                    mapped_ids.append(skill_id)
-            mapping[cls.name] = mapped_ids
+            mapping[class_name] = tuple(skills[name] for name in allowed_names if name in skills)
     return mapping
 
 
+def current_user_id():
+    """The logged-in user's id, straight from the session (cookie or X-Auth-Token).
+    Use this instead of loading the User row when only the id is needed."""
+    return session.get('user_id')
+
+
+def get_owned_character(character_id, *options):
+    """
+    Load a character only if the logged-in user owns it: one SELECT with both predicates
+    (served by the user_id index), plus whatever loader options the route passes in.
+    Returns None for missing *and* foreign characters; use character_access_error() to tell
+    them apart on that (rare) path.
+    """
+    return Character.query.options(*options).filter_by(id=character_id, user_id=current_user_id()).first()
+
+
+def owns_character(character_id):
+    """True if the logged-in user owns the character. Selects only the id, for routes that
+    write association rows directly and never need the Character object."""
+    return db.session.scalar(
+        select(Character.id).filter_by(id=character_id, user_id=current_user_id())
+    ) is not None
+
+
+def character_access_error(character_id):
+    """
+    Ownership check for protected character routes.
+    Selects only characters.user_id, so missing or foreign characters are rejected without
+    loading the row (or any eager-loaded relationships). Returns an error response, or None if
+    the logged-in user owns the character.
+    """
+    owner_id = db.session.query(Character.user_id).filter_by(id=character_id).scalar()
+    if owner_id is None:
+        return jsonify({"error": "Character not found"}), 404
+    if owner_id != session['user_id']:
+        return jsonify({"error": "Forbidden"}), 403
+    return None
+
+
 # --- API Routes ---
 
 @app.route('/register', methods=['POST'])
@@ -263,6 +559,11 @@ def register():
     return jsonify({"message": "Account created successfully", "token": token}), 201
 
 
+# Checked against when the username doesn't exist, so unknown and known users cost the same
+# hash verification and response time doesn't reveal which usernames are registered.
+_DUMMY_PASSWORD_HASH = generate_password_hash("dummy-password-for-timing")
+
+
 @app.route('/login', methods=['POST'])
 @limiter.limit("10 per minute")
 def login():
@@ -274,9 +575,13 @@ def login():
 
     username = username.strip()
     
-    user = User.query.filter_by(username=username).first()
-    
-    if user and user.check_password(password):
+    # One lookup on the unique username index, fetching only the two columns login needs.
+    user = db.session.execute(
+        select(User.id, User.password_hash).where(User.username == username)
+    ).one_or_none()
+    password_ok = check_password_hash(user.password_hash if user else _DUMMY_PASSWORD_HASH, password)
+
+    if user and password_ok:
         session['user_id'] = user.id
         session.permanent = True
         
@@ -285,7 +590,8 @@ def login():
         
         return jsonify({"message": "Logged in successfully", "user": username, "token": token}), 200
     
-    print(f"Login failed for user: '{username}'. User found: {bool(user)}")
+    # Lazy %-args: the message is only formatted when INFO logging is enabled.
+    app.logger.info("Login failed for user: %r. User found: %s", username, bool(user))
     return jsonify({"error": "Invalid credentials"}), 401
 
 
@@ -305,48 +611,103 @@ def check_auth():
 
 
 @app.route('/get-races')
+@cached_static_json
+@cache.cached(key_prefix='races')
 def get_races():
-    races = Race.query.all()
+    # Projection-only: fetch (id, name) rows instead of hydrating full Race objects.
+    races = db.session.execute(select(Race.id, Race.name)).all()
     return jsonify([{"id": r.id, "name": r.name} for r in races])
 
 
 @app.route('/get-classes')
+@cached_static_json
+@cache.cached(key_prefix='classes')
 def get_classes():
-    classes = Class.query.all()
+    classes = db.session.execute(select(Class.id, Class.name)).all()
     return jsonify([{"id": c.id, "name": c.name} for c in classes])
 
 
 @app.route('/get-backgrounds')
+@cached_static_json
+@cache.cached(key_prefix='backgrounds')
 def get_backgrounds():
-    backgrounds = Background.query.all()
+    backgrounds = db.session.execute(select(Background.id, Background.name)).all()
     return jsonify([{"id": b.id, "name": b.name} for b in backgrounds])
 
 
+@app.route('/bootstrap')
+@cached_static_json
+@cache.cached(key_prefix='bootstrap')
+def bootstrap():
+    """
+    Everything the create-character form needs on load, in one response instead of
+    separate /get-races, /get-classes and /get-backgrounds round trips.
+    """
+    races = db.session.execute(select(Race.id, Race.name)).all()
+    classes = db.session.execute(select(Class.id, Class.name)).all()
+    backgrounds = db.session.execute(select(Background.id, Background.name)).all()
+    return jsonify({
+        "races": [{"id": r.id, "name": r.name} for r in races],
+        "classes": [{"id": c.id, "name": c.name} for c in classes],
+        "backgrounds": [{"id": b.id, "name": b.name} for b in backgrounds],
+        "class_skill_map": get_class_skill_map(),
+    })
+
+
 @app.route('/get-feats')
+@versioned_by_table(Feat)
+@cache.cached(timeout=300, key_prefix='feats')
 def get_feats():
-    feats = Feat.query.all()
+    # Only id/name are returned, so don't pull the description text off disk.
+    feats = Feat.query.options(load_only(Feat.id, Feat.name)).all()
     return jsonify([{"id": f.id, "name": f.name} for f in feats])
 
 
 @app.route('/get-spells')
+@versioned_by_table(Spell)
+@cache.cached(timeout=300, key_prefix='spells')
 def get_spells():
-    spells = Spell.query.all()
+    # Spells are wide rows (school, range, components, description...); fetch just id/name.
+    spells = Spell.query.options(load_only(Spell.id, Spell.name)).all()
     return jsonify([{"id": s.id, "name": s.name} for s in spells])
 
 
+def get_class_options():
+    """
+    {"skills": [...], "equipment": [...]} as [{id, name}] lists - the pick lists offered to
+    every class. They don't depend on the class, so they're cached once and dropped by
+    invalidate_dnd_info() when a skill or item is added.
+    """
+    # Same contract as @cache.cached: a cache outage is logged and we fall back to the query.
+    try:
+        options = cache.get('class_options')
+    except Exception:
+        app.logger.exception("Cache read failed for class_options")
+        options = None
+    if options is None:
+        # One UNION ALL of (kind, id, name) rows replaces two full-table ORM loads.
+        rows = db.session.execute(union_all(
+            select(literal('skill'), Skill.id, Skill.name),
+            select(literal('equipment'), Equipment.id, Equipment.name),
+        )).all()
+        options = {
+            "skills": [{"id": row_id, "name": name} for kind, row_id, name in rows if kind == 'skill'],
+            "equipment": [{"id": row_id, "name": name} for kind, row_id, name in rows if kind == 'equipment']
+        }
+        try:
+            cache.set('class_options', options)
+        except Exception:
+            app.logger.exception("Cache write failed for class_options")
+    return options
+
+
 @app.route('/get-class-details/<int:class_id>')
 def get_class_details(class_id):
-    cls = Class.query.get_or_404(class_id)
+    # Only the name is needed, so select that column instead of materializing a Class instance.
+    class_name = db.one_or_404(select(Class.name).where(Class.id == class_id))
     # This is a bit simplified, usually you'd have a mapping table
-    # For now, we fetch all skills/equip just to populate the UI as seen in frontend
-    skills = Skill.query.all()
-    equipment = Equipment.query.all()
-    return jsonify({
-        "id": cls.id,
-        "name": cls.name,
-        "skills": [{"id": s.id, "name": s.name} for s in skills],
-        "equipment": [{"id": e.id, "name": e.name} for e in equipment]
-    })
+    # For now, we fetch all skills/equip just to populate the UI as seen in frontend.
+    return jsonify({"id": class_id, "name": class_name, **get_class_options()})
 
 
 @app.route('/create-character', methods=['POST'])
@@ -356,8 +717,16 @@ def create_character():
         return jsonify({"error": "Unauthorized"}), 401
     
     data = request.form
-    user = User.query.get(session['user_id'])
-    
+
+    # Parse every numeric field up front so a bad value is a 400 before we touch the DB
+    # or build any ORM object. Blank inputs fall back to the defaults.
+    try:
+        age = int(data.get('age') or 0)
+        level = int(data.get('level') or 1)
+        scores = {ability: int(data.get(ability) or 10) for ability in ABILITIES}
+    except ValueError as e:
+        return jsonify({"error": f"Invalid value: {str(e)}"}), 400
+
     race = Race.query.get(data.get('race'))
     char_class = Class.query.get(data.get('class'))
     background = Background.query.get(data.get('background'))
@@ -368,45 +737,40 @@ def create_character():
     # Basic char creation
     new_char = Character(
         name=data.get('name'),
-        age=int(data.get('age', 0)),
+        age=age,
         alignment=data.get('alignment'),
         hp=10, # default/starting
-        strength=int(data.get('strength', 10)),
-        dexterity=int(data.get('dexterity', 10)),
-        constitution=int(data.get('constitution', 10)),
-        intelligence=int(data.get('intelligence', 10)),
-        wisdom=int(data.get('wisdom', 10)),
-        charisma=int(data.get('charisma', 10)),
+        **scores,
         race=race,
         character_class=char_class,
-        level=int(data.get('level', 1)),
-        background=background,
-        user=user
+        level=level,
+        background=background
     )
+    new_char.user_id = current_user_id()
 
     if data.get('roll_scores') == 'true':
         new_char.roll_ability_scores()
     else:
         # If manually entering scores (Point Buy / Standard Array), we must add racial bonuses
-        new_char.strength += race.strength_bonus
-        new_char.dexterity += race.dexterity_bonus
-        new_char.constitution += race.constitution_bonus
-        new_char.intelligence += race.intelligence_bonus
-        new_char.wisdom += race.wisdom_bonus
-        new_char.charisma += race.charisma_bonus
-
-    # Handle skills/equipment if provided (comma separated or multi-form)
-    skill_ids = request.form.getlist('skills')
-    for sid in skill_ids:
-        s = Skill.query.get(sid)
-        if s: new_char.proficiencies.append(s)
-        
-    equip_ids = request.form.getlist('equipment')
-    for eid in equip_ids:
-        e = Equipment.query.get(eid)
-        if e: new_char.inventory.append(e)
+        for ability in ABILITIES:
+            setattr(new_char, ability, scores[ability] + getattr(race, f"{ability}_bonus"))
 
     db.session.add(new_char)
+    db.session.flush()  # assigns new_char.id for the association rows below
+
+    # Handle skills/equipment if provided (multi-form).
+    # The association tables only need IDs, so we validate them with one id-only SELECT
+    # and write all rows in a single INSERT instead of loading and appending each object.
+    skill_ids = existing_ids(Skill, request.form.getlist('skills'))
+    if skill_ids:
+        db.session.execute(character_proficiencies.insert(),
+                           [{"character_id": new_char.id, "skill_id": sid} for sid in skill_ids])
+
+    equip_ids = existing_ids(Equipment, request.form.getlist('equipment'))
+    if equip_ids:
+        db.session.execute(character_equipment.insert(),
+                           [{"character_id": new_char.id, "equipment_id": eid} for eid in equip_ids])
+
     db.session.commit()
     
     return jsonify({"message": "Character created", "id": new_char.id}), 201
@@ -417,17 +781,38 @@ def dashboard():
     if 'user_id' not in session:
         return jsonify({"error": "Unauthorized"}), 401
     
-    user = User.query.get(session['user_id'])
+    page = request.args.get('page', 1, type=int)
+    # Everything the roster, details panel and ledgers show comes back here, so the page no
+    # longer calls /api/get-character once per character. Many-to-one lookups ride along in the
+    # JOIN, inventory is one SELECT ... IN; paginate() fetches one page plus a COUNT(*).
+    pagination = Character.query.options(
+        joinedload(Character.race),
+        joinedload(Character.character_class),
+        joinedload(Character.background),
+        selectinload(Character.inventory),
+    ).filter_by(user_id=current_user_id()).order_by(Character.id).paginate(page=page, per_page=10, error_out=False)
     chars = [{
         "id": c.id,
         "name": c.name,
         "race": c.race.name,
         "class": c.character_class.name,
+        "background": c.background.name if c.background else "None",
         "level": c.level,
-        "image_path": c.image_path
-    } for c in user.characters]
+        "age": c.age,
+        "image_path": c.image_path,
+        **{ability: getattr(c, ability) for ability in ABILITIES},
+        "gold_pieces": c.gold_pieces,
+        "silver_pieces": c.silver_pieces,
+        "copper_pieces": c.copper_pieces,
+        "inventory": [{"id": i.id, "name": i.name} for i in c.inventory]
+    } for c in pagination.items]
     
-    return jsonify({"characters": chars})
+    return jsonify({
+        "characters": chars,
+        "page": pagination.page,
+        "pages": pagination.pages,
+        "total": pagination.total
+    })
 
 
 @app.route('/api/get-character/<int:char_id>')
@@ -435,9 +820,17 @@ def get_character(char_id):
     if 'user_id' not in session:
         return jsonify({"error": "Unauthorized"}), 401
     
-    char = Character.query.get_or_404(char_id)
-    if char.user_id != session['user_id']:
-        return jsonify({"error": "Forbidden"}), 403
+    # Many-to-one lookups ride along in the same JOIN; collections use one SELECT ... IN each.
+    char = get_owned_character(
+        char_id,
+        joinedload(Character.race),
+        joinedload(Character.character_class),
+        joinedload(Character.background),
+        selectinload(Character.proficiencies),
+        selectinload(Character.inventory),
+    )
+    if char is None:
+        return character_access_error(char_id)
     
     return jsonify({
         "id": char.id,
@@ -461,7 +854,7 @@ def get_character(char_id):
         "copper_pieces": char.copper_pieces,
         "skills": [s.id for s in char.proficiencies],
         "inventory": [{"id": i.id, "name": i.name} for i in char.inventory],
-        "available_skills": [{"id": s.id, "name": s.name} for s in Skill.query.all()]
+        "available_skills": get_class_options()["skills"]
     })
 
 
@@ -470,33 +863,44 @@ def delete_character(char_id):
     if 'user_id' not in session:
         return jsonify({"error": "Unauthorized"}), 401
     
-    char = Character.query.get_or_404(char_id)
-    if char.user_id != session['user_id']:
-        return jsonify({"error": "Forbidden"}), 403
-    
-    db.session.delete(char)
+    # Delete by (id, user_id) without loading the character. The link rows go first:
+    # the ORM used to clear them for us, and SQLite doesn't enforce ON DELETE CASCADE by default.
+    owned = select(Character.id).where(Character.id == char_id, Character.user_id == session['user_id'])
+    for link_table in (character_proficiencies, character_equipment, character_spells, character_feats):
+        db.session.execute(delete(link_table).where(link_table.c.character_id.in_(owned)))
+    deleted = db.session.execute(
+        delete(Character).where(Character.id == char_id, Character.user_id == session['user_id'])
+    ).rowcount
+    if not deleted:
+        db.session.rollback()
+        return character_access_error(char_id)
+
     db.session.commit()
     return jsonify({"message": "Character deleted"}), 200
 
 
+# Coin columns the dashboard's coin purse may set.
+CURRENCY_FIELDS = frozenset({'gold_pieces', 'silver_pieces', 'copper_pieces'})
+
+
 @app.route('/update-character-currency', methods=['POST'])
 def update_currency():
     if 'user_id' not in session:
         return jsonify({"error": "Unauthorized"}), 401
     
     data = request.get_json()
-    char = Character.query.get_or_404(data.get('character_id'))
-    if char.user_id != session['user_id']:
-        return jsonify({"error": "Forbidden"}), 403
+    char = get_owned_character(data.get('character_id'))
+    if char is None:
+        return character_access_error(data.get('character_id'))
     
     ctype = data.get('currency_type')
     val = data.get('value', 0)
     
-    if ctype == 'gold_pieces': char.gold_pieces = val
-    elif ctype == 'silver_pieces': char.silver_pieces = val
-    elif ctype == 'copper_pieces': char.copper_pieces = val
-    
-    db.session.commit()
+    # One set lookup + setattr instead of an if/elif chain; unknown types change nothing,
+    # so they skip the commit too.
+    if ctype in CURRENCY_FIELDS:
+        setattr(char, ctype, val)
+        db.session.commit()
     return jsonify({"message": "Currency updated"}), 200
 
 
@@ -514,9 +918,10 @@ def update_character():
         if not char_id:
             return jsonify({"error": "Missing character_id"}), 400
         
-        char = Character.query.get_or_404(int(char_id))
-        if char.user_id != session['user_id']:
-            return jsonify({"error": "Forbidden"}), 403
+        char_id = int(char_id)
+        char = get_owned_character(char_id)
+        if char is None:
+            return character_access_error(char_id)
         
         # Update manual fields - only if present and non-empty
         if data.get('name'): 
@@ -531,26 +936,20 @@ def update_character():
             char.hp = int(data.get('hp'))
 
         # Update Ability Scores - only if present and valid
-        if data.get('strength'): 
-            char.strength = int(data.get('strength'))
-        if data.get('dexterity'): 
-            char.dexterity = int(data.get('dexterity'))
-        if data.get('constitution'): 
-            char.constitution = int(data.get('constitution'))
-        if data.get('intelligence'): 
-            char.intelligence = int(data.get('intelligence'))
-        if data.get('wisdom'): 
-            char.wisdom = int(data.get('wisdom'))
-        if data.get('charisma'): 
-            char.charisma = int(data.get('charisma'))
+        for ability in ABILITIES:
+            if data.get(ability):
+                setattr(char, ability, int(data.get(ability)))
         
         # Update skills
-        skill_ids = request.form.getlist('skills')
-        if skill_ids:
-            char.proficiencies = []
-            for sid in skill_ids:
-                s = Skill.query.get(sid)
-                if s: char.proficiencies.append(s)
+        # Same id-only path as create_character: one DELETE, one SELECT ... IN to drop unknown
+        # ids, one INSERT - instead of loading the old list and a Skill.query.get() per id.
+        raw_skill_ids = request.form.getlist('skills')
+        if raw_skill_ids:
+            db.session.execute(delete(character_proficiencies).where(character_proficiencies.c.character_id == char.id))
+            skill_ids = existing_ids(Skill, raw_skill_ids)
+            if skill_ids:
+                db.session.execute(character_proficiencies.insert(),
+                                   [{"character_id": char.id, "skill_id": sid} for sid in skill_ids])
                 
         db.session.commit()
         return jsonify({"message": "Character updated"}), 200
@@ -559,7 +958,7 @@ def update_character():
         return jsonify({"error": f"Invalid value: {str(e)}"}), 400
     except Exception as e:
         db.session.rollback()
-        print(f"Error updating character: {e}")
+        app.logger.exception("Error updating character: %s", e)
         return jsonify({"error": f"Server error: {str(e)}"}), 500
 
 
@@ -579,9 +978,9 @@ def upload_portrait():
         return jsonify({"error": "No selected file"}), 400
         
     if file and allowed_file(file.filename):
-        char = Character.query.get_or_404(char_id)
-        if char.user_id != session['user_id']:
-            return jsonify({"error": "Forbidden"}), 403
+        char = get_owned_character(char_id)
+        if char is None:
+            return character_access_error(char_id)
             
         filename = secure_filename(f"char_{char.id}_{file.filename}")
         save_path = os.path.join(app.config['UPLOAD_FOLDER'], filename)
@@ -596,6 +995,113 @@ def upload_portrait():
     return jsonify({"error": "Invalid file type"}), 400
 
 
+# Maps the /add-dnd-info form 'type' onto the model it writes to.
+DND_INFO_MODELS = {
+    'race': Race,
+    'class': Class,
+    'background': Background,
+    'ability': Skill,
+    'equipment': Equipment,
+}
+
+# Cache keys holding data read from the table behind each /add-dnd-info type.
+DND_INFO_CACHE_KEYS = {
+    'race': ('races', 'bootstrap'),
+    'class': ('classes', 'bootstrap'),
+    'background': ('backgrounds', 'bootstrap'),
+    'ability': ('class_options', 'bootstrap'),
+    'equipment': ('equipment', 'class_options'),
+}
+
+
+def invalidate_dnd_info(itypes):
+    """Drop everything cached from the tables behind the given /add-dnd-info types."""
+    keys = {key for t in itypes for key in DND_INFO_CACHE_KEYS.get(t, ())}
+    # One delete per key: SimpleCache.delete_many() gives up at the first key that isn't
+    # cached, which would leave the rest of the set stale until they time out.
+    for key in keys:
+        try:
+            cache.delete(key)
+        except Exception:
+            # The row is already committed; a cache outage must not turn that into a 500.
+            app.logger.exception("Cache delete failed for %s", key)
+    if {'class', 'ability'} & set(itypes):
+        invalidate_class_skill_map()
+
+
+# Per /add-dnd-info type: NOT NULL text columns, optional text columns and integer columns.
+DND_INFO_REQUIRED_TEXT = {
+    'race': ('name', 'description'),
+    'class': ('name', 'description'),
+    'background': ('name', 'description'),
+    'ability': ('name', 'description', 'associated_attribute'),
+    'equipment': ('name', 'description', 'item_type'),
+}
+DND_INFO_OPTIONAL_TEXT = {'equipment': ('damage_dice', 'damage_type')}
+DND_INFO_INT_FIELDS = {
+    'race': tuple(f"{ability}_bonus" for ability in ABILITIES),
+    'class': ('hit_die',),
+    'equipment': ('ac',),
+}
+
+
+def dnd_info_error(itype, data):
+    """Why data can't be stored as an itype row, or None if it can. Run before any DB work so
+    bad input is a 400 instead of a NOT NULL/TypeError/overflow 500 halfway through."""
+    for field in DND_INFO_REQUIRED_TEXT[itype]:
+        value = data.get(field)
+        if not isinstance(value, str) or not value.strip():
+            return f"'{field}' is required"
+    for field in DND_INFO_OPTIONAL_TEXT.get(itype, ()):
+        value = data.get(field)
+        if value is not None and not isinstance(value, str):
+            return f"'{field}' must be a string"
+    for field in DND_INFO_INT_FIELDS.get(itype, ()):
+        value = data.get(field)
+        if value is None or value == '':
+            continue  # build_dnd_info() applies the default
+        try:
+            if isinstance(value, bool) or not isinstance(value, (int, str)):
+                raise ValueError
+            number = int(value)
+        except ValueError:
+            return f"'{field}' must be a whole number"
+        if abs(number) > SQLITE_MAX_INT:
+            return f"'{field}' is out of range"
+    return None
+
+
+def is_unique_violation(error):
+    """True if an IntegrityError came from a UNIQUE index (vs. e.g. a NOT NULL column)."""
+    return "UNIQUE constraint failed" in str(error.orig)
+
+
+def build_dnd_info(itype, data):
+    """Build (but don't add) the model instance for one /add-dnd-info item of the given type."""
+    if itype == 'race':
+        return Race(
+            name=data.get('name'), description=data.get('description'),
+            strength_bonus=int(data.get('strength_bonus') or 0),
+            dexterity_bonus=int(data.get('dexterity_bonus') or 0),
+            constitution_bonus=int(data.get('constitution_bonus') or 0),
+            intelligence_bonus=int(data.get('intelligence_bonus') or 0),
+            wisdom_bonus=int(data.get('wisdom_bonus') or 0),
+            charisma_bonus=int(data.get('charisma_bonus') or 0)
+        )
+    elif itype == 'class':
+        return Class(name=data.get('name'), description=data.get('description'), hit_die=int(data.get('hit_die') or 8))
+    elif itype == 'background':
+        return Background(name=data.get('name'), description=data.get('description'))
+    elif itype == 'ability':
+        return Skill(name=data.get('name'), description=data.get('description'), associated_attribute=data.get('associated_attribute'))
+    else:  # equipment
+        return Equipment(
+            name=data.get('name'), description=data.get('description'), item_type=data.get('item_type'),
+            damage_dice=data.get('damage_dice'), damage_type=data.get('damage_type'),
+            ac=int(data.get('ac', 0)) if data.get('ac') else None
+        )
+
+
 @app.route('/add-dnd-info', methods=['POST'])
 @limiter.limit("5 per minute")
 def add_dnd_info():
@@ -605,57 +1111,153 @@ def add_dnd_info():
     data = request.form
     itype = data.get('type')
     name = data.get('name')
-    desc = data.get('description')
 
-    if itype == 'race':
-        new_item = Race(
-            name=name, description=desc,
-            strength_bonus=int(data.get('strength_bonus', 0)),
-            dexterity_bonus=int(data.get('dexterity_bonus', 0)),
-            constitution_bonus=int(data.get('constitution_bonus', 0)),
-            intelligence_bonus=int(data.get('intelligence_bonus', 0)),
-            wisdom_bonus=int(data.get('wisdom_bonus', 0)),
-            charisma_bonus=int(data.get('charisma_bonus', 0))
-        )
-    elif itype == 'class':
-        new_item = Class(name=name, description=desc, hit_die=int(data.get('hit_die', 8)))
-    elif itype == 'background':
-        new_item = Background(name=name, description=desc)
-    elif itype == 'ability':
-        new_item = Skill(name=name, description=desc, associated_attribute=data.get('associated_attribute'))
-    elif itype == 'equipment':
-        new_item = Equipment(
-            name=name, description=desc, item_type=data.get('item_type'),
-            damage_dice=data.get('damage_dice'), damage_type=data.get('damage_type'),
-            ac=int(data.get('ac', 0)) if data.get('ac') else None
-        )
-    else:
+    model = DND_INFO_MODELS.get(itype)
+    if model is None:
         return jsonify({"error": "Invalid type"}), 400
+    problem = dnd_info_error(itype, data)
+    if problem:
+        return jsonify({"error": problem}), 400
 
+    # Without its unique index (database not migrated by seed-db yet) the table would take a
+    # duplicate, so only then pay for the SELECT EXISTS(...) pre-check.
+    if model.__tablename__ not in UNIQUE_NAME_TABLES and \
+            db.session.query(model.query.filter_by(name=name).exists()).scalar():
+        return jsonify({"error": f"{name} already exists in {itype}"}), 400
+
+    new_item = build_dnd_info(itype, data)
     db.session.add(new_item)
-    db.session.commit()
+    # The unique index on name rejects duplicates in the INSERT itself: no existence SELECT
+    # first, and no window for two requests to add the same name.
+    try:
+        db.session.commit()
+    except IntegrityError as e:
+        db.session.rollback()
+        if not is_unique_violation(e):
+            raise
+        return jsonify({"error": f"{name} already exists in {itype}"}), 400
+    invalidate_dnd_info([itype])
     return jsonify({"message": f"Added {name} to {itype}"}), 201
 
 
+@app.route('/add-dnd-info-bulk', methods=['POST'])
+@limiter.limit("5 per minute")
+def add_dnd_info_bulk():
+    """
+    Same as /add-dnd-info but takes a JSON array of items (each with a 'type' key),
+    so an import pays for one transaction instead of one request + commit per row.
+    Items whose name already exists are skipped and reported back.
+    """
+    if 'user_id' not in session:
+        return jsonify({"error": "Unauthorized"}), 401
+
+    items = request.get_json(silent=True)
+    if not isinstance(items, list) or not items:
+        return jsonify({"error": "Expected a JSON array of items"}), 400
+    # Validate every item before touching the DB, and say which one is wrong.
+    for index, item in enumerate(items):
+        if not isinstance(item, dict) or item.get('type') not in DND_INFO_MODELS:
+            return jsonify({"error": f"Item {index}: invalid type", "index": index}), 400
+        problem = dnd_info_error(item['type'], item)
+        if problem:
+            return jsonify({"error": f"Item {index}: {problem}", "index": index}), 400
+
+    # One SELECT name ... WHERE name IN (...) per type, instead of an EXISTS per item.
+    names_by_type = {}
+    for item in items:
+        names_by_type.setdefault(item['type'], set()).add(item.get('name'))
+    taken = {}
+    for itype, names in names_by_type.items():
+        model = DND_INFO_MODELS[itype]
+        taken[itype] = set(db.session.execute(select(model.name).where(model.name.in_(names))).scalars())
+
+    new_items, skipped, added_types = [], [], set()
+    for item in items:
+        name = item.get('name')
+        if name in taken[item['type']]:
+            skipped.append(name)
+            continue
+        taken[item['type']].add(name)  # also catches duplicates inside the same batch
+        new_items.append(build_dnd_info(item['type'], item))
+        added_types.add(item['type'])
+
+    try:
+        db.session.bulk_save_objects(new_items)
+        db.session.commit()
+    except IntegrityError as e:
+        # Lost a race with a concurrent insert of one of these names.
+        db.session.rollback()
+        if not is_unique_violation(e):
+            raise
+        return jsonify({"error": "One of the items was added concurrently, please retry"}), 409
+    invalidate_dnd_info(added_types)
+    return jsonify({"message": f"Added {len(new_items)} items", "skipped": skipped}), 201
+
+
+def attachment_response(data, filename, mimetype):
+    """
+    Serve an in-memory payload as a download.
+    Skips the BytesIO + send_file round trip; the header logic mirrors send_file's,
+    including the RFC 5987 filename* fallback for non-ASCII names.
+    """
+    resp = app.response_class(data, mimetype=mimetype)
+    try:
+        filename.encode("ascii")
+        resp.headers.set("Content-Disposition", "attachment", filename=filename)
+    except UnicodeEncodeError:
+        simple = unicodedata.normalize("NFKD", filename).encode("ascii", "ignore").decode("ascii")
+        quoted = quote(filename, safe="!#$&+-.^_`|~")
+        resp.headers.set("Content-Disposition", "attachment", filename=simple, **{"filename*": f"UTF-8''{quoted}"})
+    return resp
+
+
+# --- PDF Character Sheet ---
+# Layout constants live at module level so each download reuses them instead of rebuilding.
+SHEET_FONT = ("Helvetica", 12)
+TEXT_X = 100
+LINE_HEIGHT = 20
+
+
+def draw_header(text, char):
+    """Add the name and race/class/level lines to the sheet's text object."""
+    text.textLine(f"Character Sheet: {char.name}")
+    text.textLine(f"Race: {char.race.name} | Class: {char.character_class.name} | Level: {char.level}")
+
+
+def draw_attributes(text, char):
+    """Add the six ability scores, on two lines, to the sheet's text object."""
+    text.textLine(f"STR: {char.strength} | DEX: {char.dexterity} | CON: {char.constitution}")
+    text.textLine(f"INT: {char.intelligence} | WIS: {char.wisdom} | CHA: {char.charisma}")
+
+
 @app.route('/download-character-pdf/<int:char_id>')
 def download_character_pdf(char_id):
-    char = Character.query.get_or_404(char_id)
+    char = Character.query.options(
+        joinedload(Character.race),
+        joinedload(Character.character_class),
+    ).get_or_404(char_id)
     # Basic PDF generation logic
-    buffer = io.BytesIO()
-    p = canvas.Canvas(buffer, pagesize=letter)
-    p.drawString(100, 750, f"Character Sheet: {char.name}")
-    p.drawString(100, 730, f"Race: {char.race.name} | Class: {char.character_class.name} | Level: {char.level}")
-    p.drawString(100, 710, f"STR: {char.strength} | DEX: {char.dexterity} | CON: {char.constitution}")
-    p.drawString(100, 690, f"INT: {char.intelligence} | WIS: {char.wisdom} | CHA: {char.charisma}")
+    filename = f"{char.name}.pdf"
+    p = canvas.Canvas(filename, pagesize=letter)  # never written to disk, see getpdfdata() below
+
+    # All sheet lines share one text object: font and leading are set once, the cursor advances
+    # by itself, and the whole block goes to the page in a single BT/ET run.
+    text = p.beginText(TEXT_X, 750)
+    text.setFont(*SHEET_FONT, leading=LINE_HEIGHT)
+    draw_header(text, char)
+    draw_attributes(text, char)
+    p.drawText(text)
     p.showPage()
-    p.save()
-    buffer.seek(0)
-    return send_file(buffer, as_attachment=True, download_name=f"{char.name}.pdf", mimetype='application/pdf')
+    return attachment_response(p.getpdfdata(), filename, 'application/pdf')
 
 
 @app.route('/get-all-equipment')
+@cached_static_json
+@cache.cached(key_prefix='equipment')
 def get_all_equipment():
-    equipment = Equipment.query.all()
+    equipment = db.session.execute(
+        select(Equipment.id, Equipment.name, Equipment.item_type, Equipment.description)
+    ).all()
     return jsonify([{'id': e.id, 'name': e.name, 'item_type': e.item_type, 'description': e.description} for e in equipment])
 
 
@@ -669,18 +1271,26 @@ def add_inventory_item():
     character_id = data.get('character_id')
     item_id = data.get('item_id')
 
-    character = Character.query.get(character_id)
-    if not character or character.user_id != session['user_id']:
+    # Work on the character_equipment rows directly: no Character/Equipment objects and no
+    # lazy load of the whole inventory just to test membership. The item check is one id-only
+    # SELECT, and the composite primary key turns a duplicate into a no-op.
+    if not owns_character(character_id):
         return jsonify({'error': 'Character not found or unauthorized'}), 404
 
-    item = Equipment.query.get(item_id)
-    if not item:
+    item_ids = existing_ids(Equipment, [item_id])
+    if not item_ids:
         return jsonify({'error': 'Item not found'}), 404
+    item_id = item_ids[0]
 
-    if item in character.inventory:
+    # INSERT ... ON CONFLICT DO NOTHING: one atomic statement, no SELECT-then-INSERT race.
+    result = db.session.execute(
+        sqlite_insert(character_equipment)
+        .values(character_id=character_id, equipment_id=item_id)
+        .on_conflict_do_nothing()
+    )
+    if result.rowcount == 0:
+        db.session.rollback()
         return jsonify({'error': 'Item already in inventory'}), 400
-
-    character.inventory.append(item)
     db.session.commit()
     return jsonify({'message': 'Item added successfully'})
 
@@ -695,23 +1305,67 @@ def remove_inventory_item():
     character_id = data.get('character_id')
     item_id = data.get('item_id')
 
-    character = Character.query.get(character_id)
-    if not character or character.user_id != session['user_id']:
+    if not owns_character(character_id):
         return jsonify({'error': 'Character not found or unauthorized'}), 404
 
-    item = Equipment.query.get(item_id)
-    if not item:
+    item_ids = existing_ids(Equipment, [item_id])
+    if not item_ids:
         return jsonify({'error': 'Item not found'}), 404
+    item_id = item_ids[0]
 
-    if item in character.inventory:
-        character.inventory.remove(item)
-        db.session.commit()
-        return jsonify({'message': 'Item removed successfully'})
-    else:
+    # A single keyed DELETE; rowcount tells us whether the item was there at all.
+    result = db.session.execute(
+        delete(character_equipment).where(
+            character_equipment.c.character_id == character_id,
+            character_equipment.c.equipment_id == item_id,
+        )
+    )
+    if result.rowcount == 0:
+        db.session.rollback()
         return jsonify({'error': 'Item not in inventory'}), 400
+    db.session.commit()
+    return jsonify({'message': 'Item removed successfully'})
 
 
 # --- Database Seeding Function ---
+# Reference tables that get a unique name index, and every (table, column) pointing at them.
+# Link tables have composite primary keys, so repointing a row can collide with one the
+# character already has; those collisions are dropped instead.
+NAME_REFERENCES = {
+    'races': (('characters', 'race_id', False), ('traits', 'race_id', False)),
+    'classes': (('characters', 'character_class_id', False),),
+    'backgrounds': (('characters', 'background_id', False),),
+    'skills': (('character_proficiencies', 'skill_id', True),),
+    'equipment': (('character_equipment', 'equipment_id', True),),
+}
+
+
+def merge_duplicate_names(table):
+    """
+    Collapse rows of a reference table that share a name onto the lowest id: references are
+    repointed to that row, then the extra rows are deleted. Every merge is printed.
+    Runs inside the caller's transaction; the caller commits.
+    """
+    rows = db.session.execute(text(
+        f"SELECT id, name FROM {table} "
+        f"WHERE name IN (SELECT name FROM {table} GROUP BY name HAVING COUNT(*) > 1) ORDER BY id"
+    )).all()
+    keep = {}
+    for row_id, name in rows:
+        if name not in keep:
+            keep[name] = row_id
+            continue
+        params = {"keep": keep[name], "dup": row_id}
+        for ref_table, column, is_link in NAME_REFERENCES[table]:
+            if is_link:
+                db.session.execute(text(f"UPDATE OR IGNORE {ref_table} SET {column} = :keep WHERE {column} = :dup"), params)
+                db.session.execute(text(f"DELETE FROM {ref_table} WHERE {column} = :dup"), params)
+            else:
+                db.session.execute(text(f"UPDATE {ref_table} SET {column} = :keep WHERE {column} = :dup"), params)
+        db.session.execute(text(f"DELETE FROM {table} WHERE id = :dup"), params)
+        print(f"Merged duplicate {table} row {row_id} ('{name}') into {keep[name]}")
+
+
 def seed_database():
     """
     Creates all database tables and populates them with sample data if missing.
@@ -723,169 +1377,123 @@ def seed_database():
         # --- Schema Migrations (SQLite simple adds) ---
         # This only adds missing columns; it doesn't change security behavior.
         try:
-            info = db.session.execute(text("PRAGMA table_info(characters)")).fetchall()
-            col_names = [row[1] for row in info]
+            # The inspector reads the same column list without dialect-specific PRAGMA SQL.
+            col_names = {column["name"] for column in inspect(db.engine).get_columns("characters")}
 
             if "user_id" not in col_names:
                 print("Adding missing 'user_id' column to characters table...")
                 db.session.execute(text("ALTER TABLE characters ADD COLUMN user_id INTEGER"))
-                db.session.commit()
 
             if "image_path" not in col_names:
                 print("Adding missing 'image_path' column to characters table...")
                 db.session.execute(text("ALTER TABLE characters ADD COLUMN image_path TEXT"))
-                db.session.commit()
 
             # You use this in update_character(); ensure it exists to prevent 500s.
             if "last_updated_level" not in col_names:
                 print("Adding missing 'last_updated_level' column to characters table...")
                 db.session.execute(text("ALTER TABLE characters ADD COLUMN last_updated_level INTEGER"))
-                db.session.commit()
+
+            # create_all() doesn't add indexes to tables that already exist.
+            db.session.execute(text("CREATE INDEX IF NOT EXISTS ix_characters_user_id ON characters (user_id)"))
+
+            # One commit for all the schema changes (SQLite runs DDL inside a transaction).
+            db.session.commit()
 
         except Exception as e:
+            db.session.rollback()
             print(f"Migration check skipped or failed: {e}")
 
-        def get_or_create(model, defaults=None, **kwargs):
-            instance = model.query.filter_by(**kwargs).first()
-            if instance:
-                return instance, False
-
-            params = dict(kwargs)
-            if defaults:
-                params.update(defaults)
+        # Unique name indexes for the reference tables (see models.py). Older databases can hold
+        # duplicate names, which would block the index, so those are merged first (logged below).
+        # Each table is handled on its own, so one failure doesn't block the others.
+        for table in NAME_REFERENCES:
+            try:
+                merge_duplicate_names(table)
+                db.session.execute(text(f"CREATE UNIQUE INDEX IF NOT EXISTS ix_{table}_name ON {table} (name)"))
+                db.session.commit()
+                UNIQUE_NAME_TABLES.add(table)
+            except Exception as e:
+                db.session.rollback()
+                print(f"Could not add unique index on {table}.name: {e}")
 
-            instance = model(**params)
-            db.session.add(instance)
-            db.session.commit()
-            return instance, True
+        def missing_rows(model, rows, defaults=None):
+            """Return the rows (as dicts) whose name isn't in the table yet (one SELECT per table)."""
+            names = [row["name"] for row in rows]
+            existing = set(db.session.scalars(select(model.name).where(model.name.in_(names))))
+            return [{**(defaults or {}), **row} for row in rows if row["name"] not in existing]
 
         print("Checking/Seeding database content...")
 
-        # --------------------
-        # 1) RACES
-        # --------------------
-        races_data = [
-            {
-                "name": "Human",
-                "description": "A versatile and ambitious race.",
-                "strength_bonus": 1, "dexterity_bonus": 1, "constitution_bonus": 1,
-                "intelligence_bonus": 1, "wisdom_bonus": 1, "charisma_bonus": 1
-            },
-            {"name": "Elf", "description": "Graceful and long-lived.", "dexterity_bonus": 2, "intelligence_bonus": 1},
-            {"name": "Dwarf", "description": "Bold and hardy.", "constitution_bonus": 2},
-            {"name": "Halfling", "description": "Small and nimble.", "dexterity_bonus": 2},
-        ]
-        for r in races_data:
-            get_or_create(Race, name=r["name"], defaults=r)
+        # Reference tables have no relationships to populate, so the missing rows go in as plain
+        # dicts through one executemany INSERT per table - no ORM instances, one final commit.
+        seed_tables = (
+            (Race, RACES, None),
+            (Class, CLASSES, None),
+            (Background, BACKGROUNDS, None),
+            (Skill, SKILLS, {"description": "Standard skill"}),
+            (Equipment, EQUIPMENT, None),
+            (Spell, SPELLS, None),
+            (Feat, FEATS, None),
+        )
+        for model, rows, defaults in seed_tables:
+            new_rows = missing_rows(model, rows, defaults)
+            if new_rows:
+                db.session.execute(insert(model), new_rows)
 
         # --------------------
-        # 2) CLASSES  ✅ must be here
+        # Seed User (optional) - safe; doesn't grant extra perms
         # --------------------
-        classes_data = [
-            {"name": "Fighter", "description": "A master of combat.", "hit_die": 10},
-            {"name": "Wizard", "description": "A student of arcane magic.", "hit_die": 6},
-            {"name": "Rogue", "description": "A scoundrel who uses stealth and trickery.", "hit_die": 8},
-            {"name": "Cleric", "description": "A priestly champion who wields divine magic.", "hit_die": 8},
-        ]
-        for c in classes_data:
-            get_or_create(Class, name=c["name"], defaults=c)
+        # Regular ORM path; the password is hashed before the INSERT since password_hash is NOT NULL.
+        user = User.query.filter_by(username="seed_user").first()
+        if user is None:
+            user = User(username="seed_user")
+            user.set_password("password")
+            db.session.add(user)
+        elif not user.password_hash:
+            user.set_password("password")
 
-        # --------------------
-        # 3) BACKGROUNDS
-        # --------------------
-        backgrounds_data = [
-            {"name": "Acolyte", "description": "Serving a deity and a temple."},
-            {"name": "Soldier", "description": "A trained warrior."},
-        ]
-        for b in backgrounds_data:
-            get_or_create(Background, name=b["name"], defaults=b)
+        db.session.commit()
+        # Seeding may have added reference rows: drop the cached lookup lists (shared with the
+        # running app when REDIS_URL is set) and this process's class/skill map.
+        invalidate_dnd_info(DND_INFO_MODELS)
 
-        # --------------------
-        # 4) SKILLS
-        # --------------------
-        skills_data = [
-            {"name": "Athletics", "associated_attribute": "Strength"},
-            {"name": "Acrobatics", "associated_attribute": "Dexterity"},
-            {"name": "Stealth", "associated_attribute": "Dexterity"},
-            {"name": "Arcana", "associated_attribute": "Intelligence"},
-            {"name": "History", "associated_attribute": "Intelligence"},
-            {"name": "Investigation", "associated_attribute": "Intelligence"},
-            {"name": "Nature", "associated_attribute": "Intelligence"},
-            {"name": "Religion", "associated_attribute": "Intelligence"},
-            {"name": "Animal Handling", "associated_attribute": "Wisdom"},
-            {"name": "Insight", "associated_attribute": "Wisdom"},
-            {"name": "Medicine", "associated_attribute": "Wisdom"},
-            {"name": "Perception", "associated_attribute": "Wisdom"},
-            {"name": "Survival", "associated_attribute": "Wisdom"},
-            {"name": "Deception", "associated_attribute": "Charisma"},
-            {"name": "Intimidation", "associated_attribute": "Charisma"},
-            {"name": "Performance", "associated_attribute": "Charisma"},
-            {"name": "Persuasion", "associated_attribute": "Charisma"},
-            {"name": "Sleight of Hand", "associated_attribute": "Dexterity"},
-        ]
-        for s in skills_data:
-            get_or_create(Skill, name=s["name"], defaults={"description": "Standard skill", **s})
+        print("Database seeding check complete.")
 
-        # --------------------
-        # 5) EQUIPMENT
-        # --------------------
-        equipment_data = [
-            {"name": "LongSword", "item_type": "Weapon", "description": "1d8 slashing damage"},
-            {"name": "ShortSword", "item_type": "Weapon", "description": "1d6 piercing damage"},
-            {"name": "Dagger", "item_type": "Weapon", "description": "1d4 piercing damage"},
-            {"name": "GreatAxe", "item_type": "Weapon", "description": "1d12 slashing damage"},
-            {"name": "Shield", "item_type": "Armor", "description": "+2 AC"},
-            {"name": "Leather Armor", "item_type": "Armor", "description": "11 + Dex Modifier AC"},
-            {"name": "Chain Mail", "item_type": "Armor", "description": "16 AC"},
-            {"name": "Potion of Healing", "item_type": "Potion", "description": "Restores 2d4 + 2 HP"},
-            {"name": "Rope (50ft)", "item_type": "Adventuring Gear", "description": "Hempen rope."},
-            {"name": "Torch", "item_type": "Adventuring Gear", "description": "Provides light for 1 hour."},
-        ]
-        for e in equipment_data:
-            get_or_create(Equipment, name=e["name"], defaults=e)
 
-        # --------------------
-        # 6) SPELLS
-        # --------------------
-        spells_data = [
-            {"name": "Fireball", "level": 3, "school": "Evocation", "casting_time": "1 Action", "range_val": "150 ft",
-             "components": "V, S, M", "duration": "Instantaneous", "description": "A bright streak flashes..."},
-            {"name": "Cure Wounds", "level": 1, "school": "Evocation", "casting_time": "1 Action", "range_val": "Touch",
-             "components": "V, S", "duration": "Instantaneous", "description": "Heals 1d8 + Mod."},
-            {"name": "Magic Missile", "level": 1, "school": "Evocation", "casting_time": "1 Action", "range_val": "120 ft",
-             "components": "V, S", "duration": "Instantaneous", "description": "3 darts of force."},
-            {"name": "Shield", "level": 1, "school": "Abjuration", "casting_time": "1 Reaction", "range_val": "Self",
-             "components": "V, S", "duration": "1 Round", "description": "+5 AC."},
-            {"name": "Healing Word", "level": 1, "school": "Evocation", "casting_time": "1 Bonus Action", "range_val": "60 ft",
-             "components": "V", "duration": "Instantaneous", "description": "Heals 1d4 + Mod."},
-        ]
-        for sp in spells_data:
-            get_or_create(Spell, name=sp["name"], defaults=sp)
+# --- Unique name indexes at boot ---
+# add_dnd_info relies on ix_<table>_name to reject duplicate names. seed-db creates them, but a
+# database that never went through it (e.g. the committed site.db) would silently accept
+# duplicates, so each process also tries once at start; IF NOT EXISTS makes that a no-op
+# normally. Tables still holding duplicate names are left alone - merging rows stays an explicit
+# seed-db step - and add_dnd_info falls back to an EXISTS check for them.
+def ensure_unique_name_indexes():
+    """Create the reference-table name indexes where possible; return the tables that have one."""
+    indexed = set()
+    with app.app_context():
+        for table in NAME_REFERENCES:
+            if not inspect(db.engine).has_table(table):
+                continue  # fresh database: seed-db hasn't created the tables yet
+            try:
+                db.session.execute(text(f"CREATE UNIQUE INDEX IF NOT EXISTS ix_{table}_name ON {table} (name)"))
+                db.session.commit()
+                indexed.add(table)
+            except Exception as e:
+                db.session.rollback()
+                app.logger.warning("No unique index on %s.name, run `flask --app app seed-db`: %s", table, e)
+    return indexed
 
-        # --------------------
-        # 7) FEATS
-        # --------------------
-        feats_data = [
-            {"name": "Alert", "description": "+5 Initiative."},
-            {"name": "Mobile", "description": "+10 ft Speed."},
-            {"name": "Sharpshooter", "description": "No disadvantage at long range. -5 atk/+10 dmg."},
-            {"name": "Great Weapon Master", "description": "Bonus attack on crit/kill; -5 atk/+10 dmg option."},
-        ]
-        for f in feats_data:
-            get_or_create(Feat, name=f["name"], defaults=f)
 
-        # --------------------
-        # Seed User (optional) - safe; doesn't grant extra perms
-        # --------------------
-        user, created = get_or_create(User, username="seed_user")
-        if created or not getattr(user, "password_hash", None):
-            user.set_password("password")
-            db.session.commit()
+UNIQUE_NAME_TABLES = ensure_unique_name_indexes()
 
-        print("Database seeding check complete.")
+
+@app.cli.command('seed-db')
+def seed_db_command():
+    """Create tables, run the column migrations and insert missing reference data."""
+    seed_database()
 
 
+# Seeding is no longer part of process start (including the reloader child);
+# run `flask --app app seed-db` once after a fresh checkout or a model change.
 if __name__ == "__main__":
-    seed_database()
     # In development, we run on port 5000 as requested.
     app.run(host="0.0.0.0", port=5000, debug=True)
@@ -0,0 +1,105 @@
+# --- Lead Developer Note on Static Reference Data ---
+# Races, classes, skills and friends are fixed D&D rules: they only change when we
+# edit this file (or when someone extends the ruleset via /add-dnd-info).
+# Keeping them as plain Python constants means we build them once at import time
+# instead of re-creating the same literals inside every function call.
+
+# Ability score names, in character-sheet order. They double as the Character column names,
+# and Race stores the matching "<ability>_bonus" columns.
+ABILITIES = ('strength', 'dexterity', 'constitution', 'intelligence', 'wisdom', 'charisma')
+
+RACES = [
+    {
+        "name": "Human",
+        "description": "A versatile and ambitious race.",
+        "strength_bonus": 1, "dexterity_bonus": 1, "constitution_bonus": 1,
+        "intelligence_bonus": 1, "wisdom_bonus": 1, "charisma_bonus": 1
+    },
+    {"name": "Elf", "description": "Graceful and long-lived.", "dexterity_bonus": 2, "intelligence_bonus": 1},
+    {"name": "Dwarf", "description": "Bold and hardy.", "constitution_bonus": 2},
+    {"name": "Halfling", "description": "Small and nimble.", "dexterity_bonus": 2},
+]
+
+CLASSES = [
+    {"name": "Fighter", "description": "A master of combat.", "hit_die": 10},
+    {"name": "Wizard", "description": "A student of arcane magic.", "hit_die": 6},
+    {"name": "Rogue", "description": "A scoundrel who uses stealth and trickery.", "hit_die": 8},
+    {"name": "Cleric", "description": "A priestly champion who wields divine magic.", "hit_die": 8},
+]
+
+BACKGROUNDS = [
+    {"name": "Acolyte", "description": "Serving a deity and a temple."},
+    {"name": "Soldier", "description": "A trained warrior."},
+]
+
+SKILLS = [
+    {"name": "Athletics", "associated_attribute": "Strength"},
+    {"name": "Acrobatics", "associated_attribute": "Dexterity"},
+    {"name": "Stealth", "associated_attribute": "Dexterity"},
+    {"name": "Arcana", "associated_attribute": "Intelligence"},
+    {"name": "History", "associated_attribute": "Intelligence"},
+    {"name": "Investigation", "associated_attribute": "Intelligence"},
+    {"name": "Nature", "associated_attribute": "Intelligence"},
+    {"name": "Religion", "associated_attribute": "Intelligence"},
+    {"name": "Animal Handling", "associated_attribute": "Wisdom"},
+    {"name": "Insight", "associated_attribute": "Wisdom"},
+    {"name": "Medicine", "associated_attribute": "Wisdom"},
+    {"name": "Perception", "associated_attribute": "Wisdom"},
+    {"name": "Survival", "associated_attribute": "Wisdom"},
+    {"name": "Deception", "associated_attribute": "Charisma"},
+    {"name": "Intimidation", "associated_attribute": "Charisma"},
+    {"name": "Performance", "associated_attribute": "Charisma"},
+    {"name": "Persuasion", "associated_attribute": "Charisma"},
+    {"name": "Sleight of Hand", "associated_attribute": "Dexterity"},
+]
+
+EQUIPMENT = [
+    {"name": "LongSword", "item_type": "Weapon", "description": "1d8 slashing damage"},
+    {"name": "ShortSword", "item_type": "Weapon", "description": "1d6 piercing damage"},
+    {"name": "Dagger", "item_type": "Weapon", "description": "1d4 piercing damage"},
+    {"name": "GreatAxe", "item_type": "Weapon", "description": "1d12 slashing damage"},
+    {"name": "Shield", "item_type": "Armor", "description": "+2 AC"},
+    {"name": "Leather Armor", "item_type": "Armor", "description": "11 + Dex Modifier AC"},
+    {"name": "Chain Mail", "item_type": "Armor", "description": "16 AC"},
+    {"name": "Potion of Healing", "item_type": "Potion", "description": "Restores 2d4 + 2 HP"},
+    {"name": "Rope (50ft)", "item_type": "Adventuring Gear", "description": "Hempen rope."},
+    {"name": "Torch", "item_type": "Adventuring Gear", "description": "Provides light for 1 hour."},
+]
+
+SPELLS = [
+    {"name": "Fireball", "level": 3, "school": "Evocation", "casting_time": "1 Action", "range_val": "150 ft",
+     "components": "V, S, M", "duration": "Instantaneous", "description": "A bright streak flashes..."},
+    {"name": "Cure Wounds", "level": 1, "school": "Evocation", "casting_time": "1 Action", "range_val": "Touch",
+     "components": "V, S", "duration": "Instantaneous", "description": "Heals 1d8 + Mod."},
+    {"name": "Magic Missile", "level": 1, "school": "Evocation", "casting_time": "1 Action", "range_val": "120 ft",
+     "components": "V, S", "duration": "Instantaneous", "description": "3 darts of force."},
+    {"name": "Shield", "level": 1, "school": "Abjuration", "casting_time": "1 Reaction", "range_val": "Self",
+     "components": "V, S", "duration": "1 Round", "description": "+5 AC."},
+    {"name": "Healing Word", "level": 1, "school": "Evocation", "casting_time": "1 Bonus Action", "range_val": "60 ft",
+     "components": "V", "duration": "Instantaneous", "description": "Heals 1d4 + Mod."},
+]
+
+FEATS = [
+    {"name": "Alert", "description": "+5 Initiative."},
+    {"name": "Mobile", "description": "+10 ft Speed."},
+    {"name": "Sharpshooter", "description": "No disadvantage at long range. -5 atk/+10 dmg."},
+    {"name": "Great Weapon Master", "description": "Bonus attack on crit/kill; -5 atk/+10 dmg option."},
+]
+
+# Which skills each class may pick from, keyed by lowercase class name.
+# Classes missing from this table (e.g. homebrew ones added via /add-dnd-info) get every skill.
+CLASS_SKILL_RULES = {
+    'fighter': ['Athletics', 'Survival', 'Intimidation'],
+    'wizard': ['Stealth'],
+    'rogue': ['Stealth', 'Acrobatics', 'Deception'],
+    'cleric': ['History', 'Insight', 'Medicine'],
+    'ranger': ['Survival', 'Nature', 'Perception'],
+    'paladin': ['Religion', 'Intimidation', 'Persuasion'],
+    'bard': ['Performance', 'Persuasion', 'Deception'],
+    'druid': ['Animal Handling', 'Nature', 'Survival'],
+    'monk': ['Acrobatics', 'Stealth', 'Athletics'],
+    'barbarian': ['Athletics', 'Intimidation', 'Survival'],
+    'sorcerer': ['Arcana', 'Deception', 'Persuasion'],
+    'warlock': ['Arcana', 'Deception', 'Intimidation'],
+    'artificer': ['Arcana', 'History', 'Investigation'],
+}
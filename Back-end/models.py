@@ -54,6 +54,8 @@ character_feats = db.Table(
 
 class Character(db.Model):
     __tablename__ = 'characters'
+    # The dashboard and the owner-scoped DELETE filter on user_id; without this SQLite scans the table.
+    __table_args__ = (db.Index('ix_characters_user_id', 'user_id'),)
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String, nullable=False)
     age = db.Column(db.Integer, nullable=False)
@@ -93,10 +95,13 @@ class Character(db.Model):
     background = db.relationship('Background', backref='characters', lazy=True)
     
     # Many-to-many relationship links
-    proficiencies = db.relationship('Skill', secondary=character_proficiencies, backref=db.backref('characters_with_skill'), lazy=True)
-    inventory = db.relationship('Equipment', secondary=character_equipment, backref=db.backref('characters_with_equipment'), lazy=True)
-    spells = db.relationship('Spell', secondary=character_spells, backref=db.backref('characters_with_spell'), lazy=True)
-    feats = db.relationship('Feat', secondary=character_feats, backref=db.backref('characters_with_feat'), lazy=True)
+    # order_by lets SQLite hand these back alphabetised, so callers never need to sorted() them.
+    proficiencies = db.relationship('Skill', secondary=character_proficiencies, backref=db.backref('characters_with_skill'), lazy=True, order_by='Skill.name')
+    # lazy="raise": every reader selectinloads it and the inventory routes write the link table
+    # directly, so an implicit load here would be a new N+1 - fail loudly instead.
+    inventory = db.relationship('Equipment', secondary=character_equipment, backref=db.backref('characters_with_equipment'), lazy="raise", order_by='Equipment.name')
+    spells = db.relationship('Spell', secondary=character_spells, backref=db.backref('characters_with_spell'), lazy=True, order_by='Spell.name')
+    feats = db.relationship('Feat', secondary=character_feats, backref=db.backref('characters_with_feat'), lazy=True, order_by='Feat.name')
     
     image_path = db.Column(db.String, nullable=True)
 
@@ -118,7 +123,10 @@ class Character(db.Model):
         self.race = race 
         self.character_class = character_class 
         self.background = background
-        self.user = user
+        # Leave the relationship unset when no User is given, so a caller can set user_id directly
+        # (assigning None here would null the FK at flush time).
+        if user is not None:
+            self.user = user
         self.copper_pieces = copper_pieces
         self.silver_pieces = silver_pieces
         self.gold_pieces = gold_pieces
@@ -155,6 +163,9 @@ class Character(db.Model):
 
 class Race(db.Model):
     __tablename__ = 'races'
+    # Reference names are unique per table. The index lets SQLite reject duplicates atomically,
+    # which is what /add-dnd-info relies on instead of a separate existence SELECT.
+    __table_args__ = (db.Index('ix_races_name', 'name', unique=True),)
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String, nullable=False)
     description = db.Column(db.Text, nullable=False)
@@ -168,6 +179,7 @@ class Race(db.Model):
 
 class Class(db.Model):
     __tablename__ = 'classes'
+    __table_args__ = (db.Index('ix_classes_name', 'name', unique=True),)
     id = db.Column(db.Integer, primary_key=True)
     # Lead Dev Note: We keep this simple now, but we'll likely need to add 
     # 'spellcasting_ability' fields here later as we expand the magic system.
@@ -177,12 +189,14 @@ class Class(db.Model):
 
 class Background(db.Model):
     __tablename__ = 'backgrounds'
+    __table_args__ = (db.Index('ix_backgrounds_name', 'name', unique=True),)
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String, nullable=False)
     description = db.Column(db.Text, nullable=False)
 
 class Skill(db.Model):
     __tablename__ = 'skills'
+    __table_args__ = (db.Index('ix_skills_name', 'name', unique=True),)
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String, nullable=False)
     description = db.Column(db.Text, nullable=False)
@@ -190,6 +204,7 @@ class Skill(db.Model):
 
 class Equipment(db.Model):
     __tablename__ = 'equipment'
+    __table_args__ = (db.Index('ix_equipment_name', 'name', unique=True),)
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String, nullable=False)
     description = db.Column(db.Text, nullable=False)